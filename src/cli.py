@@ -1,150 +1,227 @@
 """Command-line interface: input parsing, validation and command dispatch."""
 
-from .constants import Command, STORAGE_PATH
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from .constants import AVAILABLE_COMMANDS_HINT, Command, STORAGE_PATH
 from .handlers import input_error, show_help
 from .models import AddressBook
-from .exceptions import InvalidInputError
+from .exceptions import DataFileTooLargeError, InvalidInputError
 from .storage import AddressBookStorage
 
 
-@input_error
-def parse_input(user_input: str):
-    """Parse raw user input into a `(Command, args)` tuple with validation.
+_EXACT_TWO: Dict[Command, str] = {
+    Command.ADD: "<name> <phone>",
+    Command.ADD_BIRTHDAY: "<name> <birthday>",
+    Command.ADD_EMAIL: "<name> <email>",
+    Command.REMOVE_EMAIL: "<name> <email>",
+}
+_EXACT_THREE: Dict[Command, str] = {
+    Command.EDIT_EMAIL: "<name> <old_email> <new_email>",
+}
+_AT_LEAST_THREE: Dict[Command, str] = {
+    Command.EDIT: "<name> <field> <value>",
+}
+_AT_LEAST_TWO: Dict[Command, str] = {
+    Command.ADD_ADDRESS: "<name> <address>",
+    Command.EDIT_ADDRESS: "<name> <address>",
+    Command.ADD_NOTE: "<name> <note_text>",
+    Command.EDIT_NOTE: "<name> <note_text>",
+}
+_EXACT_ONE: Dict[Command, str] = {
+    Command.PHONE: "<name>",
+    Command.SHOW_BIRTHDAY: "<name>",
+    Command.SHOW_EMAIL: "<name>",
+    Command.SHOW_ADDRESS: "<name>",
+    Command.DELETE_NOTE: "<name>",
+    Command.REMOVE_ADDRESS: "<name>",
+    Command.DELETE: "<name>",
+    Command.SEARCH: "<query>",
+    Command.SEARCH_TAGS: "<tag>",
+}
+_AT_LEAST_ONE: Dict[Command, str] = {
+    Command.SEARCH_NOTES: "<query>",
+}
+_OPTIONAL_ONE: Dict[Command, str] = {
+    Command.BIRTHDAYS: "<days>",
+}
+_NO_ARGS: FrozenSet[Command] = frozenset(
+    {Command.ALL, Command.HELP, Command.SORT_TAGS}
+)
+
+_EXIT_COMMANDS: FrozenSet[Command] = frozenset({Command.EXIT, Command.CLOSE})
+# Commands handled by the CLI loop itself, accepted with any arguments.
+_NO_VALIDATION: FrozenSet[Command] = _EXIT_COMMANDS | {Command.HELLO}
+
+# Commands whose whole argument string is one free-form value.
+_RAW_TAIL_COMMANDS: FrozenSet[Command] = frozenset({Command.SEARCH_NOTES})
+
+_TEXT_COMMANDS: Dict[Command, str] = {
+    Command.ADD_ADDRESS: "<address>",
+    Command.EDIT_ADDRESS: "<address>",
+    Command.ADD_NOTE: "<note_text>",
+    Command.EDIT_NOTE: "<note_text>",
+}
+
+
+_PROMPT = "Enter a command: "
+
+_MISSING_PARAMS_ERROR = (
+    "Your input is incorrect. You forgot additional parameters. Use: {name} {usage}"
+)
+_OPTIONAL_PARAMS_ERROR = "Your input is incorrect. Use: {name} [{usage}]"
+_NO_PARAMS_ERROR = (
+    "Your input is incorrect. Command '{name}' doesn't need additional parameters."
+)
+_TEXT_PARAMS_ERROR = "Your input is incorrect. Use: {name} <name> {usage}"
+
+
+@lru_cache(maxsize=None)
+def _invalid_command_error() -> str:
+    """Return the unknown-command message, rendering help on first use only."""
+    return f"Invalid command.\n{show_help([])}"
+
+
+def _prebuild_errors(template: str, usages: Dict[Command, str]) -> Dict[Command, str]:
+    """Format an error template once for every command in a usage table.
 
     Args:
-        user_input: Line entered by the user.
+        template: Message with `{name}` and optional `{usage}` placeholders.
+        usages: Mapping of command to its argument usage hint.
 
     Returns:
-        A tuple `(command_enum, args)` where `command_enum` is a member of
-        `Command` and `args` is a list of already-normalized string arguments.
+        Dict[Command, str]: Fully formatted error message per command.
+    """
+    return {
+        command: template.format(name=command.name.replace("_", "-"), usage=usage)
+        for command, usage in usages.items()
+    }
+
+
+def _exactly(count: int) -> Callable[[int], bool]:
+    """Return a validator accepting exactly `count` arguments."""
+    return lambda n: n == count
+
+
+def _at_least(count: int) -> Callable[[int], bool]:
+    """Return a validator accepting `count` or more arguments."""
+    return lambda n: n >= count
+
+
+def _at_most(count: int) -> Callable[[int], bool]:
+    """Return a validator accepting up to `count` arguments."""
+    return lambda n: n <= count
+
+
+_ARITY_RULES: Tuple[Tuple[Dict[Command, str], Callable[[int], bool], str], ...] = (
+    (_EXACT_TWO, _exactly(2), _MISSING_PARAMS_ERROR),
+    (_EXACT_THREE, _exactly(3), _MISSING_PARAMS_ERROR),
+    (_AT_LEAST_THREE, _at_least(3), _MISSING_PARAMS_ERROR),
+    (_AT_LEAST_TWO, _at_least(2), _MISSING_PARAMS_ERROR),
+    (_EXACT_ONE, _exactly(1), _MISSING_PARAMS_ERROR),
+    (_AT_LEAST_ONE, _at_least(1), _MISSING_PARAMS_ERROR),
+    (_OPTIONAL_ONE, _at_most(1), _OPTIONAL_PARAMS_ERROR),
+    (dict.fromkeys(_NO_ARGS, ""), _exactly(0), _NO_PARAMS_ERROR),
+)
+
+# Command -> (argument-count validator, pre-formatted error message).
+_ARITY: Dict[Command, Tuple[Callable[[int], bool], str]] = {
+    command: (is_valid, message)
+    for usages, is_valid, template in _ARITY_RULES
+    for command, message in _prebuild_errors(template, usages).items()
+}
+_TEXT_ERRORS: Dict[Command, str] = _prebuild_errors(
+    _TEXT_PARAMS_ERROR, _TEXT_COMMANDS
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_line(user_input: str) -> Tuple[Command, Tuple[str, ...]]:
+    """Parse and validate a line; results are memoized per exact line.
+
+    Failed parses raise and are therefore never cached.
+
+    Args:
+        user_input: Stripped line entered by the user.
+
+    Returns:
+        Tuple[Command, Tuple[str, ...]]: Resolved command and its arguments.
 
     Raises:
         InvalidInputError: If command is unknown or arguments count is invalid.
     """
-    command, *args = user_input.strip().split()
-    command = command.upper()
+    command, *rest = user_input.split(maxsplit=1)
 
-    if command not in Command.available_commands():
-        raise InvalidInputError(f"Invalid command.\n{show_help([])}")
+    # Interned keys let the lookup below match on identity.
+    command_enum = Command.from_cli(sys.intern(command))
+    if command_enum is None:
+        raise InvalidInputError(_invalid_command_error())
 
-    command_enum = Command[command.replace("-", "_")]
-    command_name = command_enum.name.replace("_", "-")
+    tail = rest[0] if rest else ""
+    args: Tuple[str, ...]
+    if command_enum in _NO_VALIDATION:
+        return command_enum, tuple(tail.split())
 
-    exact_two = {
-        Command.ADD: "<name> <phone>",
-        Command.ADD_BIRTHDAY: "<name> <birthday>",
-        Command.ADD_EMAIL: "<name> <email>",
-        Command.REMOVE_EMAIL: "<name> <email>",
-    }
-    exact_three = {
-        Command.EDIT_EMAIL: "<name> <old_email> <new_email>",
-    }
-    at_least_three = {
-        Command.EDIT: "<name> <field> <value>",
-    }
-    at_least_two = {
-        Command.ADD_ADDRESS: "<name> <address>",
-        Command.EDIT_ADDRESS: "<name> <address>",
-        Command.ADD_NOTE: "<name> <note_text>",
-        Command.EDIT_NOTE: "<name> <note_text>",
-    }
-    exact_one = {
-        Command.PHONE: "<name>",
-        Command.SHOW_BIRTHDAY: "<name>",
-        Command.SHOW_EMAIL: "<name>",
-        Command.SHOW_ADDRESS: "<name>",
-        Command.DELETE_NOTE: "<name>",
-        Command.REMOVE_ADDRESS: "<name>",
-        Command.DELETE: "<name>",
-        Command.SEARCH: "<query>",
-        Command.SEARCH_TAGS: "<tag>",
-    }
-    at_least_one = {
-        Command.SEARCH_NOTES: "<query>",
-    }
-    optional_one = {
-        Command.BIRTHDAYS: "<days>",
-    }
-    no_args = {Command.ALL, Command.HELP, Command.SORT_TAGS}
-
-    text_commands = {
-        Command.ADD_ADDRESS,
-        Command.EDIT_ADDRESS,
-        Command.ADD_NOTE,
-        Command.EDIT_NOTE,
-    }
-
-    if command_enum in text_commands:
+    if command_enum in _TEXT_COMMANDS:
+        # Free-form text is taken as typed instead of split and re-joined.
+        args = tuple(tail.split(maxsplit=1))
         if len(args) < 2:
-            allowed = "<address>" if "ADDRESS" in command_enum.name else "<note_text>"
-            raise InvalidInputError(
-                f"Your input is incorrect. Use: {
-                    command_name} <name> {allowed}"
-            )
-        name, *text_parts = args
-        joined_text = " ".join(text_parts).strip()
-        if not joined_text:
-            allowed = "<address>" if "ADDRESS" in command_enum.name else "<note_text>"
-            raise InvalidInputError(
-                f"Your input is incorrect. Use: {
-                    command_name} <name> {allowed}"
-            )
-        args = [name, joined_text]
-
-    if command_enum in exact_two and len(args) != 2:
-        raise InvalidInputError(
-            f"Your input is incorrect. You forgot additional parameters. Use: {
-                command_name} {exact_two[command_enum]}"
-        )
-    elif command_enum in exact_three and len(args) != 3:
-        raise InvalidInputError(
-            f"Your input is incorrect. You forgot additional parameters. Use: {
-                command_name} {exact_three[command_enum]}"
-        )
-    elif command_enum in at_least_three and len(args) < 3:
-        raise InvalidInputError(
-            f"Your input is incorrect. You forgot additional parameters. Use: {
-                command_name} {at_least_three[command_enum]}"
-        )
-    elif command_enum in at_least_two and len(args) < 2:
-        raise InvalidInputError(
-            f"Your input is incorrect. You forgot additional parameters. Use: {
-                command_name} {at_least_two[command_enum]}"
-        )
-    elif command_enum in exact_one and len(args) != 1:
-        raise InvalidInputError(
-            f"Your input is incorrect. You forgot additional parameters. Use: {
-                command_name} {exact_one[command_enum]}"
-        )
-    elif command_enum in at_least_one and len(args) < 1:
-        raise InvalidInputError(
-            f"Your input is incorrect. You forgot additional parameters. Use: {
-                command_name} {at_least_one[command_enum]}"
-        )
-    elif command_enum in optional_one and len(args) > 1:
-        raise InvalidInputError(
-            f"Your input is incorrect. Use: {
-                command_name} [{optional_one[command_enum]}]"
-        )
-    elif command_enum in no_args and len(args) != 0:
-        raise InvalidInputError(
-            f"Your input is incorrect. Command '{
-                command_name}' doesn't need additional parameters."
-        )
+            raise InvalidInputError(_TEXT_ERRORS[command_enum])
+    elif command_enum in _RAW_TAIL_COMMANDS:
+        args = (tail,) if tail else ()
+    else:
+        args = tuple(tail.split())
+
+    rule = _ARITY.get(command_enum)
+    if rule is not None and not rule[0](len(args)):
+        raise InvalidInputError(rule[1])
 
     return command_enum, args
 
 
-def main():
+@input_error
+def parse_input(user_input: str) -> Optional[Tuple[Command, Tuple[str, ...]]]:
+    """Parse raw user input into a `(Command, args)` tuple with validation.
+
+    Args:
+        user_input: Stripped line entered by the user.
+
+    Returns:
+        A tuple `(command_enum, args)` where `command_enum` is a member of
+        `Command` and `args` is an immutable tuple of string arguments shared
+        with the parse cache.
+
+    Raises:
+        InvalidInputError: If command is unknown or arguments count is invalid.
+    """
+    return _parse_line(user_input)
+
+
+def main() -> None:
     """Run the interactive CLI loop."""
     storage = AddressBookStorage(STORAGE_PATH)
-    address_book: AddressBook = storage.load_or_new()
+    try:
+        address_book: AddressBook = storage.load_or_new()
+    except DataFileTooLargeError as e:
+        # Exit without saving so the data file is left untouched.
+        sys.exit(str(e))
     print("Welcome to the assistant bot!")
+    # Keep input() for terminals (line editing/history); piped input is
+    # read directly and ends the session cleanly on EOF.
+    interactive = sys.stdin.isatty()
     while True:
-        input_command = input("Enter a command: ")
+        if interactive:
+            input_command = input(_PROMPT)
+        else:
+            sys.stdout.write(_PROMPT)
+            sys.stdout.flush()
+            input_command = sys.stdin.readline()
+            if not input_command:
+                break
+        input_command = input_command.strip()
         if not input_command:
-            print(f"Use one of commands: {
-                  ', '.join(Command.available_commands())}")
+            print(AVAILABLE_COMMANDS_HINT)
             continue
 
         parsed_input = parse_input(input_command)
@@ -152,14 +229,14 @@ def main():
             continue
 
         command, args = parsed_input
-        if command in (Command.EXIT, Command.CLOSE):
+        if command in _EXIT_COMMANDS:
             print("Good bye!")
             storage.save(address_book)
             break
         elif command == Command.HELLO:
             print("Hello! How can I help you?")
         else:
-            result = command.func(args, address_book=address_book)
+            result = command.func(list(args), address_book=address_book)
             if result is not None:
                 print(result)
 
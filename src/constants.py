@@ -1,7 +1,7 @@
 """Global constants and command registry used by the CLI."""
 
-from enum import Enum
-from typing import List
+import sys
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
 
 from .handlers import (
     add_address,
@@ -33,45 +33,132 @@ from .handlers import (
 STORAGE_PATH = "data/addressbook.pkl"
 
 
-class Command(Enum):
-    """Command registry: maps command names to ordering and handler functions."""
-    ADD = 0, add_contact
-    EDIT = 1, edit_contact
-    CLOSE = 2, None
-    EXIT = 3, None
-    HELLO = 4, None
-    PHONE = 5, show_phone
-    ALL = 6, show_all
-    ADD_BIRTHDAY = 7, add_birthday
-    SHOW_BIRTHDAY = 8, show_birthday
-    BIRTHDAYS = 9, birthdays
-    ADD_EMAIL = 10, add_email
-    REMOVE_EMAIL = 11, remove_email
-    EDIT_EMAIL = 12, edit_email
-    SHOW_EMAIL = 13, show_email
-    ADD_ADDRESS = 14, add_address
-    EDIT_ADDRESS = 15, edit_address
-    REMOVE_ADDRESS = 16, remove_address
-    SHOW_ADDRESS = 17, show_address
-    SEARCH = 18, search_contacts
-    ADD_NOTE = 19, add_note
-    EDIT_NOTE = 20, edit_note
-    DELETE_NOTE = 21, delete_note
-    SEARCH_NOTES = 22, search_notes
-    DELETE = 23, delete_user
-    HELP = 24, show_help
-    SEARCH_TAGS = 25, search_tags
-    SORT_TAGS = 26, sort_tags
-
-    def __init__(self, order, func):
+class Command:
+    """Command registry: maps command names to ordering and handler functions.
+
+    Members are plain singletons attached to the class after its definition
+    (e.g. `Command.ADD`); they compare and hash by identity.
+
+    Args:
+        name: Upper-case command name with underscores.
+        order: Position of the command in the registry.
+        func: Handler called with `(args, address_book)`, or None for
+            commands handled directly by the CLI loop.
+    """
+
+    __slots__ = ("name", "order", "func")
+
+    # Declared here for type checkers; assigned below the class body.
+    ADD: ClassVar["Command"]
+    EDIT: ClassVar["Command"]
+    CLOSE: ClassVar["Command"]
+    EXIT: ClassVar["Command"]
+    HELLO: ClassVar["Command"]
+    PHONE: ClassVar["Command"]
+    ALL: ClassVar["Command"]
+    ADD_BIRTHDAY: ClassVar["Command"]
+    SHOW_BIRTHDAY: ClassVar["Command"]
+    BIRTHDAYS: ClassVar["Command"]
+    ADD_EMAIL: ClassVar["Command"]
+    REMOVE_EMAIL: ClassVar["Command"]
+    EDIT_EMAIL: ClassVar["Command"]
+    SHOW_EMAIL: ClassVar["Command"]
+    ADD_ADDRESS: ClassVar["Command"]
+    EDIT_ADDRESS: ClassVar["Command"]
+    REMOVE_ADDRESS: ClassVar["Command"]
+    SHOW_ADDRESS: ClassVar["Command"]
+    SEARCH: ClassVar["Command"]
+    ADD_NOTE: ClassVar["Command"]
+    EDIT_NOTE: ClassVar["Command"]
+    DELETE_NOTE: ClassVar["Command"]
+    SEARCH_NOTES: ClassVar["Command"]
+    DELETE: ClassVar["Command"]
+    HELP: ClassVar["Command"]
+    SEARCH_TAGS: ClassVar["Command"]
+    SORT_TAGS: ClassVar["Command"]
+
+    def __init__(
+        self, name: str, order: int, func: Optional[Callable[..., Any]]
+    ) -> None:
+        self.name = name
         self.order = order
         self.func = func
 
+    def __repr__(self) -> str:
+        return f"Command.{self.name}"
+
     @classmethod
-    def available_commands(cls) -> List[str]:
+    def available_commands(cls) -> Tuple[str, ...]:
         """Return CLI-friendly command names.
 
         Returns:
-            List[str]: All command names formatted with hyphens.
+            Tuple[str, ...]: All command names formatted with hyphens, in
+            declaration order. Built once at import time.
+        """
+        return _AVAILABLE_COMMANDS
+
+    @classmethod
+    def from_cli(cls, name: str) -> Optional["Command"]:
+        """Resolve a CLI command name to its `Command` member.
+
+        Lower- and upper-case spellings hit the table directly; any other
+        casing falls back to upper-casing the name first.
+
+        Args:
+            name: Command name with hyphens, any case (e.g. "add-birthday").
+
+        Returns:
+            Command | None: Matching member, or None if the name is unknown.
         """
-        return [x.name.replace("_", "-") for x in cls]
+        command = _BY_CLI_NAME.get(name)
+        if command is None:
+            command = _BY_CLI_NAME.get(name.upper())
+        return command
+
+
+Command.ADD = Command("ADD", 0, add_contact)
+Command.EDIT = Command("EDIT", 1, edit_contact)
+Command.CLOSE = Command("CLOSE", 2, None)
+Command.EXIT = Command("EXIT", 3, None)
+Command.HELLO = Command("HELLO", 4, None)
+Command.PHONE = Command("PHONE", 5, show_phone)
+Command.ALL = Command("ALL", 6, show_all)
+Command.ADD_BIRTHDAY = Command("ADD_BIRTHDAY", 7, add_birthday)
+Command.SHOW_BIRTHDAY = Command("SHOW_BIRTHDAY", 8, show_birthday)
+Command.BIRTHDAYS = Command("BIRTHDAYS", 9, birthdays)
+Command.ADD_EMAIL = Command("ADD_EMAIL", 10, add_email)
+Command.REMOVE_EMAIL = Command("REMOVE_EMAIL", 11, remove_email)
+Command.EDIT_EMAIL = Command("EDIT_EMAIL", 12, edit_email)
+Command.SHOW_EMAIL = Command("SHOW_EMAIL", 13, show_email)
+Command.ADD_ADDRESS = Command("ADD_ADDRESS", 14, add_address)
+Command.EDIT_ADDRESS = Command("EDIT_ADDRESS", 15, edit_address)
+Command.REMOVE_ADDRESS = Command("REMOVE_ADDRESS", 16, remove_address)
+Command.SHOW_ADDRESS = Command("SHOW_ADDRESS", 17, show_address)
+Command.SEARCH = Command("SEARCH", 18, search_contacts)
+Command.ADD_NOTE = Command("ADD_NOTE", 19, add_note)
+Command.EDIT_NOTE = Command("EDIT_NOTE", 20, edit_note)
+Command.DELETE_NOTE = Command("DELETE_NOTE", 21, delete_note)
+Command.SEARCH_NOTES = Command("SEARCH_NOTES", 22, search_notes)
+Command.DELETE = Command("DELETE", 23, delete_user)
+Command.HELP = Command("HELP", 24, show_help)
+Command.SEARCH_TAGS = Command("SEARCH_TAGS", 25, search_tags)
+Command.SORT_TAGS = Command("SORT_TAGS", 26, sort_tags)
+
+_MEMBERS: Tuple[Command, ...] = tuple(
+    sorted(
+        (x for x in vars(Command).values() if isinstance(x, Command)),
+        key=lambda x: x.order,
+    )
+)
+_AVAILABLE_COMMANDS: Tuple[str, ...] = tuple(
+    x.name.replace("_", "-") for x in _MEMBERS
+)
+_BY_CLI_NAME: Dict[str, Command] = {
+    sys.intern(spelling): command
+    for name, command in zip(_AVAILABLE_COMMANDS, _MEMBERS)
+    for spelling in (name, name.lower())
+}
+
+AVAILABLE_COMMANDS_HINT = (
+    f"Use one of commands: {', '.join(Command.available_commands())}"
+)
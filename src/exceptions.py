@@ -1,7 +1,25 @@
 """Custom exception classes for CLI validation and domain errors."""
 
+__all__ = [
+    "AddressBookError",
+    "DataFileTooLargeError",
+    "DuplicateRecordError",
+    "EditCommandNotFound",
+    "EmailNotFoundError",
+    "InvalidAddressError",
+    "InvalidBirthdayError",
+    "InvalidDaysError",
+    "InvalidEmailError",
+    "InvalidInputError",
+    "InvalidNameError",
+    "InvalidPhoneError",
+    "InvalidSearchQueryError",
+    "PhoneNotFoundError",
+    "RecordNotFoundError",
+]
 
-class AddressBookError(Exception):
+
+class AddressBookError(ValueError):
     """Base exception for address book errors."""
 
 
@@ -13,6 +31,10 @@ class InvalidInputError(ValueError):
     """Raised when CLI input is syntactically incorrect."""
 
 
+class DuplicateRecordError(ValueError):
+    """Raised when trying to add a record that already exists."""
+
+
 class InvalidNameError(ValueError):
     """Raised when a name is empty or invalid."""
 
@@ -53,70 +75,5 @@ class EditCommandNotFound(ValueError):
     """Raised when an unsupported field is provided to the edit command."""
 
 
-class AddressBookError(ValueError):
-    pass
-
-
-class InvalidNameError(ValueError):
-    """Raised when a name is empty or invalid."""
-    pass
-
-
-class InvalidPhoneError(ValueError):
-    """Raised when a phone number cannot be parsed or is invalid."""
-    pass
-
-
-class RecordNotFoundError(ValueError):
-    """Raised when a contact/record is not found."""
-    pass
-
-
-class DuplicateRecordError(ValueError):
-    """Raised when trying to add a record that already exists."""
-    pass
-
-
-class PhoneNotFoundError(ValueError):
-    """Raised when a phone number is not present in a record."""
-    pass
-
-
-class InvalidBirthdayError(ValueError):
-    """Raised for invalid birthday formats or future dates."""
-    pass
-
-
-class InvalidEmailError(ValueError):
-    """Raised when an email has invalid format."""
-    pass
-
-
-class EmailNotFoundError(ValueError):
-    """Raised when an email is not present in a record."""
-    pass
-
-
-class InvalidAddressError(ValueError):
-    """Raised when an address is empty or otherwise invalid."""
-    pass
-
-
-class InvalidSearchQueryError(ValueError):
-    """Raised when a search query is empty."""
-    pass
-
-
-class InvalidInputError(ValueError):
-    """Raised when CLI input is syntactically incorrect."""
-    pass
-
-
-class InvalidDaysError(ValueError):
-    """Raised when days parameter is negative."""
-    pass
-
-
-class EditCommandNotFound(ValueError):
-    """Raised when an unsupported field is provided to the edit command."""
-    pass
+class DataFileTooLargeError(OSError):
+    """Raised when the data file exceeds the size the storage will load."""
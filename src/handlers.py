@@ -1,6 +1,11 @@
 """Handlers: business logic for all supported commands and table helpers."""
 
-from typing import List, Dict
+import re
+import sys
+from datetime import date
+from functools import lru_cache, wraps
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, cast
 
 from prettytable import PrettyTable
 
@@ -83,32 +88,94 @@ _COMMAND_USAGE: Dict[str, str] = {
     "delete": "delete [name]"
 }
 
+# (usage, description) pairs in display order for the help table.
+_HELP_ROWS = tuple(
+    (_COMMAND_USAGE[cmd], description)
+    for cmd, description in _COMMAND_DESCRIPTIONS.items()
+)
+
+# Lowercased field name -> EditField for the `edit` command.
+_EDIT_FIELDS: Dict[str, EditField] = {
+    sys.intern(field.value): field for field in EditField
+}
+
 _COMMON_COUNT_DAYS = 7
 
 
+# Contact table headers keyed by (include_note, include_tags).
+_CONTACT_FIELDS: Dict[Tuple[bool, bool], Tuple[str, ...]] = {
+    (note, tags): ("Name", "Phones", "Emails", "Address", "Birthday")
+    + (("Note",) if note else ())
+    + (("Tags",) if tags else ())
+    for note in (False, True)
+    for tags in (False, True)
+}
+
+# Listings longer than this are printed as plain tab-separated rows.
+_PLAIN_TABLE_THRESHOLD = 500
+
+_BIRTHDAYS_TITLE = "UPCOMING BIRTHDAYS"
+_BIRTHDAYS_FIELDS = ("Name", "Congratulation Date")
+_BIRTHDAYS_CACHE_SIZE = 8
+_BIRTHDAYS_CACHE: Dict[Tuple[int, int, date, int], str] = {}
+
+# [(book id, revision), rendered table] of the last `all` listing.
+_SHOW_ALL_CACHE: List[Any] = [None, ""]
+
+
+_USAGE_EDIT_GENERIC = "Usage: edit <name> <field> <value>"
+_USAGE_EDIT_PHONE_EMAIL = (
+    "Usage for phone/email: "
+    "edit <name> phone <old_phone> <new_phone> | "
+    "edit <name> email <old_email> <new_email>"
+)
+_USAGE_EDIT_ADDRESS = "Usage: edit <name> address <new address>"
+_USAGE_EDIT_BIRTHDAY = "Usage: edit <name> birthday <DD.MM.YYYY>"
+_USAGE_SEARCH_NOTES = "Usage: search-notes <query>"
+
+_get_value = attrgetter("value")
+
+# Handler-name fragments stripped from TypeError messages such as
+# "add_contact() missing 1 required positional argument".
+_ERROR_NOISE_RE = re.compile(r"_contact|show_|\(\)")
+
+
 def input_error(func):
     """Decorator to catch common input errors and print a concise message.
 
     Returns:
         Wrapped function that prints the error and returns None on failure.
     """
+    @wraps(func)
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except (TypeError, ValueError) as e:
-            error_message = str(e)
-            if "_contact" in error_message:
-                error_message = error_message.replace("_contact", "")
-            if "show_" in error_message:
-                error_message = error_message.replace("show_", "")
-            if "()" in error_message:
-                error_message = error_message.replace("()", "")
-            print(error_message)
+        except (TypeError, ValueError, LookupError) as e:
+            print(_ERROR_NOISE_RE.sub("", str(e)))
             return None
 
     return inner
 
 
+def _require_record(address_book: AddressBook, name: str) -> Record:
+    """Return the record for `name` or raise if the contact is missing.
+
+    Args:
+        address_book: Book to search.
+        name: Exact contact name.
+
+    Returns:
+        Record: The matching contact record.
+
+    Raises:
+        RecordNotFoundError: If no contact with this name exists.
+    """
+    record = address_book.find(name)
+    if record is None:
+        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    return record
+
+
 def _build_contacts_table(
     title: str, include_note: bool = False, include_tags: bool = False
 ) -> PrettyTable:
@@ -122,39 +189,75 @@ def _build_contacts_table(
     Returns:
         PrettyTable instance configured for contacts.
     """
-    field_names = ["Name", "Phones", "Emails", "Address", "Birthday"]
-    if include_note:
-        field_names.append("Note")
-    if include_tags:
-        field_names.append("Tags")
-    table = PrettyTable(title=title, field_names=field_names)
-    for field in field_names:
-        table.align[field] = "l"
+    table = PrettyTable(
+        title=title, field_names=_CONTACT_FIELDS[include_note, include_tags]
+    )
+    table.align = "l"
     return table
 
 
-def _format_contact_row(record: Record, include_note: bool = False) -> List[str]:
+def _add_row(table: PrettyTable, row: Sequence[str]) -> None:
+    """Append a row to `table`.
+
+    PrettyTable accepts any sequence but annotates `add_row` as taking a
+    list; the rows built here are tuples, so the cast lives in one place.
+
+    Args:
+        table: Table to extend.
+        row: Cell values, one per column.
+    """
+    table.add_row(cast(List[Any], row))
+
+
+def _render_plain(
+    title: str, field_names: Tuple[str, ...], rows: Iterable[Tuple[str, ...]]
+) -> str:
+    """Render rows as tab-separated lines, one line per row.
+
+    Used instead of PrettyTable for very large listings, which it would have
+    to measure and pad cell by cell. Multi-line cells are joined with ", ".
+
+    Args:
+        title: Heading printed on the first line.
+        field_names: Column headers.
+        rows: Row values in display order.
+
+    Returns:
+        str: The rendered listing.
+    """
+    lines = [title, "\t".join(field_names)]
+    lines.extend(
+        "\t".join(cell.replace("\n", ", ") for cell in row) for row in rows
+    )
+    return "\n".join(lines)
+
+
+def _format_contact_row(
+    record: Record, include_note: bool = False, include_tags: bool = False
+) -> Tuple[str, ...]:
     """Format a single `Record` into a table row.
 
     Args:
         record: Contact record to render.
         include_note: Whether to include the note text.
+        include_tags: Whether to include the note's hashtags.
 
     Returns:
-        List[str]: Values for the contact table row.
+        Tuple[str, ...]: Values for the contact table row.
     """
-    row = [
+    address = record.address
+    note = record.note
+    row: Tuple[str, ...] = (
         record.name.value,
-        "\n".join(
-            phone.value for phone in record.phones) if record.phones else "N/A",
-        "\n".join(
-            email.value for email in record.emails) if record.emails else "N/A",
-        record.address.value if record.address else "N/A",
-        record.birthday.value.strftime(
-            "%d.%m.%Y") if record.birthday else "N/A",
-    ]
+        record.phones_text or "N/A",
+        record.emails_text or "N/A",
+        address.value if address else "N/A",
+        record.birthday_text or "N/A",
+    )
     if include_note:
-        row.append(record.note or "N/A")
+        row += (note or "N/A",)
+    if include_tags:
+        row += (", ".join(extract_tags(note)) if note else "N/A",)
     return row
 
 
@@ -199,9 +302,7 @@ def add_birthday(args: List[str], address_book: AddressBook) -> str:
         RecordNotFoundError, InvalidBirthdayError
     """
     name, birthday = args
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     message = "Birthday updated." if record.birthday is not None else "Birthday added."
     record.add_birthday(birthday)
     return message
@@ -219,9 +320,7 @@ def show_birthday(args: List[str], address_book: AddressBook) -> str:
         Birthday string or info message.
     """
     name = args[0]
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     if record.birthday is None:
         return f"Contact '{name}' doesn't have a birthday set."
     return str(record.birthday)
@@ -239,10 +338,8 @@ def show_phone(args: List[str], address_book: AddressBook) -> str:
         List of phone strings formatted as a Python list literal.
     """
     name = args[0]
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
-    return f"{[x.value for x in record.phones]}"
+    record = _require_record(address_book, name)
+    return f"[{', '.join(map(repr, map(_get_value, record.phones)))}]"
 
 
 @input_error
@@ -260,9 +357,7 @@ def add_email(args: List[str], address_book: AddressBook) -> str:
         RecordNotFoundError, InvalidEmailError
     """
     name, email = args
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     record.add_email(email)
     return "Email added."
 
@@ -279,9 +374,7 @@ def remove_email(args: List[str], address_book: AddressBook) -> str:
         Confirmation message.
     """
     name, email = args
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     record.remove_email(email)
     return "Email removed."
 
@@ -298,9 +391,7 @@ def edit_email(args: List[str], address_book: AddressBook) -> str:
         Confirmation message.
     """
     name, old_email, new_email = args
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     record.edit_email(old_email, new_email)
     return "Email updated."
 
@@ -317,10 +408,8 @@ def show_email(args: List[str], address_book: AddressBook) -> str:
         List of email strings formatted as a Python list literal.
     """
     name = args[0]
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
-    return f"{[x.value for x in record.emails]}"
+    record = _require_record(address_book, name)
+    return f"[{', '.join(map(repr, map(_get_value, record.emails)))}]"
 
 
 @input_error
@@ -335,10 +424,8 @@ def add_address(args: List[str], address_book: AddressBook) -> str:
         Confirmation message.
     """
     name, address_text = args
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
-    if not address_text.strip():
+    record = _require_record(address_book, name)
+    if not address_text or address_text.isspace():
         raise InvalidAddressError("Address cannot be empty.")
     message = "Address updated." if record.address else "Address added."
     record.set_address(address_text)
@@ -357,10 +444,8 @@ def edit_address(args: List[str], address_book: AddressBook) -> str:
         Confirmation message.
     """
     name, address_text = args
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
-    if not address_text.strip():
+    record = _require_record(address_book, name)
+    if not address_text or address_text.isspace():
         raise InvalidAddressError("Address cannot be empty.")
     message = "Address updated." if record.address else "Address added."
     record.set_address(address_text)
@@ -379,9 +464,7 @@ def remove_address(args: List[str], address_book: AddressBook) -> str:
         Confirmation message.
     """
     name = args[0]
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     if record.address is None:
         raise InvalidAddressError(
             f"Contact '{name}' does not have an address.")
@@ -401,9 +484,7 @@ def show_address(args: List[str], address_book: AddressBook) -> str:
         Address string or info message.
     """
     name = args[0]
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
+    record = _require_record(address_book, name)
     if record.address is None:
         return f"Contact '{name}' doesn't have an address."
     return record.address.value
@@ -422,14 +503,25 @@ def show_all(_: List[str], address_book: AddressBook) -> str:
     """
     if address_book.is_empty:
         raise AddressBookError("Address Book is empty...")
-    table = _build_contacts_table("CONTACTS", include_note=True)
-    table.add_rows(
-        [
-            _format_contact_row(record, include_note=True)
-            for record in address_book.records.values()
-        ]
-    )
-    return str(table)
+    cache_key = (id(address_book), address_book.revision)
+    if _SHOW_ALL_CACHE[0] == cache_key:
+        return _SHOW_ALL_CACHE[1]
+    records = address_book.record_list
+    if len(records) > _PLAIN_TABLE_THRESHOLD:
+        rendered = _render_plain(
+            "CONTACTS",
+            _CONTACT_FIELDS[True, False],
+            (_format_contact_row(record, include_note=True) for record in records),
+        )
+    else:
+        table = _build_contacts_table("CONTACTS", include_note=True)
+        # add_rows() needs a sequence and slices it, so rows are streamed in
+        # one at a time instead of materializing the whole list first.
+        for record in records:
+            _add_row(table, _format_contact_row(record, include_note=True))
+        rendered = str(table)
+    _SHOW_ALL_CACHE[:] = [cache_key, rendered]
+    return rendered
 
 
 @input_error
@@ -441,7 +533,7 @@ def birthdays(args: List[str], address_book: AddressBook) -> str:
         address_book: Book to read.
 
     Returns:
-        String representation of the PrettyTable.
+        String representation of the PrettyTable or 'No upcoming birthdays.'.
 
     Raises:
         InvalidDaysError: If days is negative.
@@ -453,16 +545,23 @@ def birthdays(args: List[str], address_book: AddressBook) -> str:
         if (int(args[0]) < 0):
             raise InvalidDaysError(f"The number of days cannot be negative.")
         days = int(args[0])
-    table = PrettyTable(
-        title="UPCOMING BIRTHDAYS", field_names=["Name", "Congratulation Date"]
-    )
-    table.add_rows(
-        [
-            [x["name"], x["congratulation_date"]]
-            for x in address_book.get_upcoming_birthdays(days)
-        ]
-    )
-    return str(table)
+
+    # The result only changes with the book's contents or the current date.
+    today = date.today()
+    cache_key = (id(address_book), address_book.revision, today, days)
+    rendered = _BIRTHDAYS_CACHE.get(cache_key)
+    if rendered is None:
+        upcoming = address_book.get_upcoming_birthdays(days, today=today)
+        if upcoming:
+            table = PrettyTable(title=_BIRTHDAYS_TITLE, field_names=_BIRTHDAYS_FIELDS)
+            table.add_rows([[x["name"], x["congratulation_date"]] for x in upcoming])
+            rendered = str(table)
+        else:
+            rendered = "No upcoming birthdays."
+        if len(_BIRTHDAYS_CACHE) >= _BIRTHDAYS_CACHE_SIZE:
+            _BIRTHDAYS_CACHE.clear()
+        _BIRTHDAYS_CACHE[cache_key] = rendered
+    return rendered
 
 
 @input_error
@@ -495,13 +594,14 @@ def search_contacts(args: List[str], address_book: AddressBook) -> str:
     )
 
     for record in found_records:
-        table.add_row(_format_contact_row(record, include_note=True))
+        _add_row(table, _format_contact_row(record, include_note=True))
 
     return str(table)
 
 
-def show_help(*args, **kwargs) -> str:
-    """Return a help table with commands and descriptions.
+@lru_cache(maxsize=None)
+def _render_help() -> str:
+    """Render the static help table once; later calls reuse the string.
 
     Returns:
         String representation of the PrettyTable.
@@ -509,16 +609,69 @@ def show_help(*args, **kwargs) -> str:
     table = PrettyTable(
         title="AVAILABLE COMMANDS", field_names=["Command", "Description"]
     )
-    table.align["Command"] = "l"
-    table.align["Description"] = "l"
+    table.align = "l"
 
-    for cmd in _COMMAND_DESCRIPTIONS:
-        usage = "close, exit" if cmd == "close" else _COMMAND_USAGE[cmd]
-        table.add_row([usage, _COMMAND_DESCRIPTIONS[cmd]])
+    for row in _HELP_ROWS:
+        _add_row(table, row)
 
     return str(table)
 
 
+def show_help(*args, **kwargs) -> str:
+    """Return a help table with commands and descriptions.
+
+    Returns:
+        String representation of the PrettyTable.
+    """
+    return _render_help()
+
+
+def _edit_phone(record: Record, name: str, rest: List[str]) -> str:
+    """Replace one phone of `record`: rest is [old_phone, new_phone]."""
+    if len(rest) != 2:
+        return _USAGE_EDIT_PHONE_EMAIL
+    old_value, new_value = rest
+    record.edit_phone(old_value, new_value)
+    return f"Phone for '{name}' updated: '{old_value}' → '{new_value}'"
+
+
+def _edit_email(record: Record, name: str, rest: List[str]) -> str:
+    """Replace one email of `record`: rest is [old_email, new_email]."""
+    if len(rest) != 2:
+        return _USAGE_EDIT_PHONE_EMAIL
+    old_value, new_value = rest
+    record.edit_email(old_value, new_value)
+    return f"Email for '{name}' updated: '{old_value}' → '{new_value}'"
+
+
+def _edit_address(record: Record, name: str, rest: List[str]) -> str:
+    """Set the address of `record`: rest holds the address words."""
+    if not rest:
+        return _USAGE_EDIT_ADDRESS
+    new_address = " ".join(rest).strip()
+    if not new_address:
+        raise InvalidAddressError("Address cannot be empty.")
+    record.set_address(new_address)
+    return f"Address for '{name}' updated."
+
+
+def _edit_birthday(record: Record, name: str, rest: List[str]) -> str:
+    """Set the birthday of `record`: rest is [DD.MM.YYYY]."""
+    if len(rest) != 1:
+        return _USAGE_EDIT_BIRTHDAY
+    new_birthday_str = rest[0]
+    record.edit_birthday(new_birthday_str)
+    return f"Birthday for '{name}' updated to '{new_birthday_str}'"
+
+
+_EDIT_DISPATCH: Dict[EditField, Callable[[Record, str, List[str]], str]] = {
+    EditField.PHONE: _edit_phone,
+    EditField.EMAIL: _edit_email,
+    EditField.ADDRESS: _edit_address,
+    EditField.BIRTHDAY: _edit_birthday,
+}
+
+
 @input_error
 def edit_contact(args: List[str], address_book: AddressBook) -> str:
     """
@@ -535,61 +688,19 @@ def edit_contact(args: List[str], address_book: AddressBook) -> str:
     """
 
     if len(args) < 3:
-        return "Usage: edit <name> <field> <value>"
+        return _USAGE_EDIT_GENERIC
 
     name = args[0]
     field_str = args[1]
     rest = args[2:]
 
-    try:
-        field = EditField.from_str(field_str)
-    except ValueError as ex:
+    # Interned keys let the lookup below match on identity.
+    field = _EDIT_FIELDS.get(sys.intern(field_str.lower()))
+    if field is None:
         raise EditCommandNotFound(f"Edit '{field_str}' command doesn't exist.")
 
-    record = address_book.find(name)
-    if record is None:
-        raise RecordNotFoundError(f"Contact '{name}' doesn't exist.")
-
-    if field in (EditField.PHONE, EditField.EMAIL):
-        if len(rest) != 2:
-            return (
-                "Usage for phone/email: "
-                "edit <name> phone <old_phone> <new_phone> | "
-                "edit <name> email <old_email> <new_email>"
-            )
-
-        old_value, new_value = rest
-
-        if field == EditField.PHONE:
-            record.edit_phone(old_value, new_value)
-            return (
-                f"Phone for '{name}' updated: '{old_value}' → '{new_value}'"
-            )
-
-        if field == EditField.EMAIL:
-            record.edit_email(old_value, new_value)
-            return (
-                f"Email for '{name}' updated: '{old_value}' → '{new_value}'"
-            )
-
-    if field == EditField.ADDRESS:
-        if not rest:
-            return "Usage: edit <name> address <new address>"
-        new_address = " ".join(rest).strip()
-        if not new_address:
-            raise InvalidAddressError("Address cannot be empty.")
-        record.set_address(new_address)
-        return f"Address for '{name}' updated."
-
-    if field == EditField.BIRTHDAY:
-        if len(rest) != 1:
-            return "Usage: edit <name> birthday <DD.MM.YYYY>"
-
-        new_birthday_str = rest[0]
-        record.edit_birthday(new_birthday_str)
-        return f"Birthday for '{name}' updated to '{new_birthday_str}'"
-
-    return "Nothing was updated"
+    record = _require_record(address_book, name)
+    return _EDIT_DISPATCH[field](record, name, rest)
 
 
 @input_error
@@ -613,14 +724,14 @@ def add_note(args: List[str], address_book: AddressBook) -> str:
     """Attach a free-form note to a contact (overwrites existing).
 
     Args:
-        args: [name, text...]
+        args: [name, text]
         address_book: Book to update.
 
     Returns:
         Confirmation message or error text.
     """
     name = args[0]
-    note_text = " ".join(args[1:])
+    note_text = args[1]
 
     record = address_book.find(name)
     if not record:
@@ -635,14 +746,14 @@ def edit_note(args: List[str], address_book: AddressBook) -> str:
     """Edit an existing note of a contact.
 
     Args:
-        args: [name, text...]
+        args: [name, text]
         address_book: Book to update.
 
     Returns:
         Confirmation message or error text.
     """
     name = args[0]
-    new_text = " ".join(args[1:])
+    new_text = args[1]
 
     record = address_book.find(name)
     if not record:
@@ -683,16 +794,16 @@ def search_notes(args: List[str], address_book: AddressBook) -> str:
     """Search contacts by substring inside notes.
 
     Args:
-        args: [query...]
+        args: [query]
         address_book: Book to search.
 
     Returns:
         String representation of the PrettyTable or 'No notes found.'.
     """
     if len(args) < 1:
-        return "Usage: search-notes <query>"
+        return _USAGE_SEARCH_NOTES
 
-    query = " ".join(args)
+    query = args[0]
     results = address_book.search_by_notes(query)
 
     if not results:
@@ -701,7 +812,7 @@ def search_notes(args: List[str], address_book: AddressBook) -> str:
     table = _build_contacts_table("SEARCH NOTES RESULTS", include_note=True)
 
     for record in results:
-        table.add_row(_format_contact_row(record, include_note=True))
+        _add_row(table, _format_contact_row(record, include_note=True))
 
     return str(table)
 
@@ -728,7 +839,7 @@ def search_tags(args: List[str], address_book: AddressBook) -> str:
     )
 
     for record in results:
-        table.add_row(_format_contact_row(record, include_note=True))
+        _add_row(table, _format_contact_row(record, include_note=True))
 
     return str(table)
 
@@ -754,9 +865,9 @@ def sort_tags(args: List[str], address_book: AddressBook) -> str:
     )
 
     for record in sorted_records:
-        row = _format_contact_row(record, include_note=True)
-        row.append(", ".join(extract_tags(record.note))
-                   if record.note else "N/A")
-        table.add_row(row)
+        _add_row(
+            table,
+            _format_contact_row(record, include_note=True, include_tags=True),
+        )
 
     return str(table)
@@ -1,11 +1,16 @@
 """Domain models: fields, records, address book and related utilities."""
 
 import re
+import string
+import sys
+from calendar import isleap
 from collections import UserDict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
-import phonenumbers
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from types import ModuleType
 
 from .exceptions import (
     EmailNotFoundError,
@@ -19,6 +24,108 @@ from .exceptions import (
 )
 
 
+_get_value = attrgetter("value")
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+_EMAIL_MIN_LENGTH = 6
+
+# Advanced by every mutation of a Record or AddressBook; lets callers
+# cache derived views and detect when they are stale.
+_revision = 0
+
+
+def _touch() -> None:
+    """Advance the shared revision counter after a mutation."""
+    global _revision
+    _revision += 1
+
+
+@lru_cache(maxsize=None)
+def _phonenumbers() -> ModuleType:
+    """Import phonenumbers on first use; its metadata is slow to load.
+
+    Returns:
+        ModuleType: The phonenumbers module.
+    """
+    import phonenumbers
+
+    return phonenumbers
+
+
+# Region assumed for numbers entered without a country code.
+_DEFAULT_PHONE_REGION = "UA"
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone(phone_number: str) -> str:
+    """Parse, validate and format a phone number as E.164; memoized.
+
+    Failed numbers raise and are therefore never cached.
+
+    Args:
+        phone_number: Number as typed, local ("UA") or international.
+
+    Returns:
+        str: The number in E.164 format.
+
+    Raises:
+        InvalidPhoneError: If the number is not valid.
+        NumberParseException: If the number cannot be parsed at all.
+    """
+    phonenumbers = _phonenumbers()
+    parsed_number = phonenumbers.parse(phone_number, _DEFAULT_PHONE_REGION)
+
+    if not phonenumbers.is_valid_number(parsed_number):
+        raise InvalidPhoneError(
+            f"The number '{phone_number}' is not a valid phone number.")
+
+    # Format and return the number in E.164 standard
+    return phonenumbers.format_number(
+        parsed_number, phonenumbers.PhoneNumberFormat.E164
+    )
+
+
+def _format_date(value: date) -> str:
+    """Format a date as DD.MM.YYYY without going through strftime.
+
+    Args:
+        value: Date or datetime to format.
+
+    Returns:
+        str: The formatted date.
+    """
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+
+def _bigrams(text: str) -> Set[str]:
+    """Return every two-character substring of `text`.
+
+    Args:
+        text: String to split.
+
+    Returns:
+        Set[str]: Distinct bigrams; empty for strings shorter than two.
+    """
+    return {text[start:start + 2] for start in range(len(text) - 1)}
+
+
+def _discard_bigrams(postings: Dict[str, Set[str]], key: str, text: str) -> None:
+    """Remove `key` from the postings of every bigram in `text`.
+
+    Args:
+        postings: Bigram -> keys mapping to update in place.
+        key: Key previously indexed under `text`.
+        text: Lowercased text the key was indexed with.
+    """
+    for bigram in _bigrams(text):
+        keys = postings[bigram]
+        keys.discard(key)
+        if not keys:
+            del postings[bigram]
+
+
 def extract_tags(note: str) -> list[str]:
     if not note:
         return []
@@ -52,8 +159,8 @@ class EditField(str, Enum):
             return cls(value)
         except ValueError:
             raise ValueError(
-                f"Unknown field '{
-                    value}'. Allowed: phone, email, address, birthday"
+                f"Unknown field '{value}'. "
+                "Allowed: phone, email, address, birthday"
             )
 
 
@@ -64,9 +171,19 @@ class Field:
         value: Underlying primitive value.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    def __setstate__(self, state):
+        # Slotted instances pickle as (None, slots); fields saved before
+        # __slots__ was introduced carry a plain __dict__ instead.
+        if isinstance(state, tuple):
+            state = state[1]
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def __str__(self):
         return str(self.value)
 
@@ -78,11 +195,16 @@ class Name(Field):
         InvalidNameError: If value is empty.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
-        if not value or not value.strip():
+        if not value or value.isspace():
             raise InvalidNameError("Name cannot be empty.")
         super().__init__(value.strip())
 
+    def __str__(self):
+        return self.value
+
 
 class Phone(Field):
     """Validated phone number stored in E.164 format.
@@ -91,14 +213,16 @@ class Phone(Field):
         InvalidPhoneError: If number cannot be parsed/validated.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         try:
             formatted_value = self.validate_phone(value)
-        except phonenumbers.phonenumberutil.NumberParseException as e:
+        except _phonenumbers().phonenumberutil.NumberParseException as e:
             raise InvalidPhoneError(
                 f"Could not parse phone number: '{value}'.") from e
 
-        super().__init__(formatted_value)
+        super().__init__(sys.intern(formatted_value))
 
     @staticmethod
     def validate_phone(phone_number: str) -> str:
@@ -111,45 +235,62 @@ class Phone(Field):
         Returns:
             str: The phone number in E.164 format (e.g., "+380951234567").
         """
-        # Set a default region for parsing numbers without a country code.
-        default_region = "UA"
+        return _normalize_phone(phone_number)
 
-        parsed_number = phonenumbers.parse(phone_number, default_region)
-
-        if not phonenumbers.is_valid_number(parsed_number):
-            raise InvalidPhoneError(
-                f"The number '{phone_number}' is not a valid phone number.")
-
-        # Format and return the number in E.164 standard
-        formatted_number = phonenumbers.format_number(
-            parsed_number, phonenumbers.PhoneNumberFormat.E164
-        )
-        return formatted_number
+    def __str__(self):
+        return self.value
 
 
 class Birthday(Field):
     """Birthday date parsed from DD.MM.YYYY; cannot be in the future.
 
+    Args:
+        value: Date string in DD.MM.YYYY format.
+        today: Reference date for the future check; defaults to the clock.
+
     Raises:
         InvalidBirthdayError: On bad format or future date.
     """
 
-    def __init__(self, value):
-        try:
-            parsed_date = datetime.strptime(value.strip(), "%d.%m.%Y")
-        except ValueError:
-            raise InvalidBirthdayError("Invalid date format. Use DD.MM.YYYY")
+    __slots__ = ("md",)
+
+    def __init__(self, value, today: Optional[date] = None):
+        parsed_date = self._parse(value)
 
-        today = datetime.now().date()
+        if today is None:
+            today = datetime.now().date()
         birthday_date = parsed_date.date()
 
         if birthday_date > today:
             raise InvalidBirthdayError("Birthday cannot be in the future.")
 
         super().__init__(parsed_date)
+        self.md = (parsed_date.month, parsed_date.day)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.md = (self.value.month, self.value.day)
+
+    @staticmethod
+    def _parse(value: str) -> datetime:
+        """Parse a DD.MM.YYYY string without any clock-dependent checks.
+
+        Args:
+            value: Date string in DD.MM.YYYY format.
+
+        Returns:
+            datetime: Parsed date at midnight.
+
+        Raises:
+            InvalidBirthdayError: On bad format.
+        """
+        try:
+            return datetime.strptime(value.strip(), "%d.%m.%Y")
+        except ValueError:
+            raise InvalidBirthdayError("Invalid date format. Use DD.MM.YYYY")
 
     def __str__(self):
-        return self.value.strftime("%d.%m.%Y")
+        return _format_date(self.value)
 
 
 class Email(Field):
@@ -159,6 +300,8 @@ class Email(Field):
         InvalidEmailError: If email format is invalid.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         if not self._validate_email(value):
             raise InvalidEmailError(
@@ -168,11 +311,28 @@ class Email(Field):
 
     @staticmethod
     def _validate_email(email: str) -> bool:
-        if not email or not email.strip():
+        if not email or email.isspace():
+            return False
+        email = email.strip()
+        # "a@b.cd" is the shortest acceptable address.
+        if len(email) < _EMAIL_MIN_LENGTH or "@" not in email:
             return False
-        pattern = re.compile(
-            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        return bool(pattern.match(email.strip()))
+        # Equivalent to ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$ but
+        # checked with set lookups, so no input can make it backtrack.
+        local, at, domain = email.partition("@")
+        if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+            return False
+        host, dot, tld = domain.rpartition(".")
+        return (
+            bool(dot)
+            and bool(host)
+            and len(tld) >= 2
+            and _EMAIL_TLD_CHARS.issuperset(tld)
+            and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        )
+
+    def __str__(self):
+        return self.value
 
 
 class Address(Field):
@@ -182,11 +342,16 @@ class Address(Field):
         InvalidAddressError: If address is empty.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
-        if not value or not value.strip():
+        if not value or value.isspace():
             raise InvalidAddressError("Address cannot be empty.")
         super().__init__(value.strip())
 
+    def __str__(self):
+        return self.value
+
 
 class Record:
     """Contact record aggregating fields: name, phones, emails, address, birthday, note.
@@ -195,6 +360,22 @@ class Record:
         name: Contact name.
     """
 
+    # Pickled as a fixed-shape tuple of the persistent fields; the cached
+    # display and search strings are rebuilt on load.
+    __slots__ = (
+        "name",
+        "phones",
+        "emails",
+        "address",
+        "birthday",
+        "note",
+        "_phones_joined",
+        "_emails_joined",
+        "_bday_str",
+        "_name_lower",
+        "_note_lower",
+    )
+
     def __init__(self, name):
         self.name = Name(name)
         self.phones = []
@@ -202,15 +383,74 @@ class Record:
         self.address = None
         self.birthday = None
         self.note = None
+        self._phones_joined = ""
+        self._emails_joined = ""
+        self._bday_str = ""
+        self._name_lower = self.name.value.lower()
+        self._note_lower = None
 
     def __setstate__(self, state):
-        self.__dict__ = state
-        if not hasattr(self, "emails"):
-            self.emails = []
-        if not hasattr(self, "address"):
-            self.address = None
-        if not hasattr(self, "note"):
-            self.note = None
+        if isinstance(state, dict):
+            # Records pickled before __slots__ carry their __dict__; older
+            # ones still lack emails, address and note.
+            state = (
+                state["name"],
+                state["phones"],
+                state.get("emails", []),
+                state.get("address"),
+                state.get("birthday"),
+                state.get("note"),
+            )
+        (
+            self.name,
+            self.phones,
+            self.emails,
+            self.address,
+            self.birthday,
+            self.note,
+        ) = state
+        self._refresh_phones()
+        self._refresh_emails()
+        self._refresh_birthday()
+        self._name_lower = self.name.value.lower()
+        self._note_lower = self.note.lower() if self.note else None
+
+    def __getstate__(self):
+        return (
+            self.name,
+            self.phones,
+            self.emails,
+            self.address,
+            self.birthday,
+            self.note,
+        )
+
+    def _refresh_phones(self) -> None:
+        """Rebuild the cached phone display string after a change."""
+        self._phones_joined = "\n".join(map(_get_value, self.phones))
+
+    def _refresh_emails(self) -> None:
+        """Rebuild the cached email display string after a change."""
+        self._emails_joined = "\n".join(map(_get_value, self.emails))
+
+    def _refresh_birthday(self) -> None:
+        """Rebuild the cached birthday display string after a change."""
+        self._bday_str = str(self.birthday) if self.birthday else ""
+
+    @property
+    def phones_text(self) -> str:
+        """Phone numbers joined by newlines, or "" when there are none."""
+        return self._phones_joined
+
+    @property
+    def emails_text(self) -> str:
+        """Email addresses joined by newlines, or "" when there are none."""
+        return self._emails_joined
+
+    @property
+    def birthday_text(self) -> str:
+        """Birthday formatted as DD.MM.YYYY, or "" when not set."""
+        return self._bday_str
 
     def add_phone(self, phone: str) -> None:
         """Append a validated phone number.
@@ -223,6 +463,8 @@ class Record:
         """
         phone_obj = Phone(phone)
         self.phones.append(phone_obj)
+        self._refresh_phones()
+        _touch()
 
     def remove_phone(self, phone: str) -> None:
         """Remove a phone by value (any format acceptable).
@@ -234,8 +476,9 @@ class Record:
             PhoneNotFoundError: If the phone is not present.
             InvalidPhoneError: If the provided phone cannot be normalized.
         """
-        phone_to_remove = self.find_phone(phone)
-        self.phones.remove(phone_to_remove)
+        del self.phones[self._phone_position(phone)]
+        self._refresh_phones()
+        _touch()
 
     def edit_phone(self, old_phone: str, new_phone: str) -> None:
         """Replace an existing phone with a new validated value.
@@ -248,9 +491,10 @@ class Record:
             PhoneNotFoundError: If old phone is not present.
             InvalidPhoneError: If new phone is invalid.
         """
-        phone_to_edit = self.find_phone(old_phone)
-        idx = self.phones.index(phone_to_edit)
+        idx = self._phone_position(old_phone)
         self.phones[idx] = Phone(new_phone)
+        self._refresh_phones()
+        _touch()
 
     def find_phone(self, phone: str) -> Phone:
         """Find a phone object by string value (normalized to E.164).
@@ -265,18 +509,28 @@ class Record:
             PhoneNotFoundError: If phone not present in record.
             InvalidPhoneError: If the input cannot be parsed/normalized.
         """
+        return self.phones[self._phone_position(phone)]
+
+    def _phone_position(self, phone: str) -> int:
+        """Return the index of `phone` in `self.phones` in a single scan.
+
+        Raises:
+            PhoneNotFoundError: If phone not present in record.
+        """
         try:
             normalized_phone = Phone.validate_phone(phone)
-        except (InvalidPhoneError, phonenumbers.phonenumberutil.NumberParseException):
+        except (InvalidPhoneError, _phonenumbers().phonenumberutil.NumberParseException):
             raise PhoneNotFoundError(
                 f"Phone '{phone}' is not a valid phone format and was not found.") from None
 
-        for phone_obj in self.phones:
+        for idx, phone_obj in enumerate(self.phones):
             if phone_obj.value == normalized_phone:
-                return phone_obj
+                return idx
 
-        raise PhoneNotFoundError(f"Phone '{phone}' (normalized to '{
-                                 normalized_phone}') not found in record {self.name.value}.")
+        raise PhoneNotFoundError(
+            f"Phone '{phone}' (normalized to '{normalized_phone}') "
+            f"not found in record {self.name.value}."
+        )
 
     def find_email(self, email: str) -> Email:
         """Find an email object by its normalized string value.
@@ -290,9 +544,18 @@ class Record:
         Raises:
             EmailNotFoundError: If email is not present.
         """
-        for email_obj in self.emails:
-            if email_obj.value == email.lower().strip():
-                return email_obj
+        return self.emails[self._email_position(email)]
+
+    def _email_position(self, email: str) -> int:
+        """Return the index of `email` in `self.emails` in a single scan.
+
+        Raises:
+            EmailNotFoundError: If email is not present.
+        """
+        normalized_email = email.lower().strip()
+        for idx, email_obj in enumerate(self.emails):
+            if email_obj.value == normalized_email:
+                return idx
         raise EmailNotFoundError(
             f"Email {email} not found in record {self.name.value}.")
 
@@ -307,6 +570,8 @@ class Record:
         """
         email_obj = Email(email)
         self.emails.append(email_obj)
+        self._refresh_emails()
+        _touch()
 
     def remove_email(self, email: str) -> None:
         """Remove an email by value.
@@ -317,8 +582,9 @@ class Record:
         Raises:
             EmailNotFoundError: If email is not present.
         """
-        email_to_remove = self.find_email(email)
-        self.emails.remove(email_to_remove)
+        del self.emails[self._email_position(email)]
+        self._refresh_emails()
+        _touch()
 
     def edit_email(self, old_email: str, new_email: str) -> None:
         """Replace an existing email with a new validated email.
@@ -331,9 +597,10 @@ class Record:
             EmailNotFoundError: If old email is not present.
             InvalidEmailError: If new email is invalid.
         """
-        email_to_edit = self.find_email(old_email)
-        idx = self.emails.index(email_to_edit)
+        idx = self._email_position(old_email)
         self.emails[idx] = Email(new_email)
+        self._refresh_emails()
+        _touch()
 
     def add_birthday(self, birthday: str) -> None:
         """Set birthday from a DD.MM.YYYY string.
@@ -345,6 +612,8 @@ class Record:
             InvalidBirthdayError: On bad format or future date.
         """
         self.birthday = Birthday(birthday)
+        self._refresh_birthday()
+        _touch()
 
     def edit_birthday(self, birthday: str) -> None:
         """Update birthday from a DD.MM.YYYY string.
@@ -356,6 +625,8 @@ class Record:
             InvalidBirthdayError: On bad format or future date.
         """
         self.birthday = Birthday(birthday)
+        self._refresh_birthday()
+        _touch()
 
     def set_address(self, address: str) -> None:
         """Set or update address.
@@ -367,21 +638,21 @@ class Record:
             InvalidAddressError: If address is empty.
         """
         self.address = Address(address)
+        _touch()
 
     def remove_address(self) -> None:
         """Remove address from the record."""
         self.address = None
+        _touch()
 
     def __str__(self):
         """Return a compact string representation of the record."""
-        parts = [f"Contact name: {self.name.value}"]
-        if self.phones:
-            parts.append(f"phones: {'; '.join(p.value for p in self.phones)}")
-        if self.emails:
-            parts.append(f"emails: {'; '.join(e.value for e in self.emails)}")
-        if self.address:
-            parts.append(f"address: {self.address.value}")
-        return ", ".join(parts)
+        return "".join((
+            f"Contact name: {self.name.value}",
+            f", phones: {'; '.join([p.value for p in self.phones])}" if self.phones else "",
+            f", emails: {'; '.join([e.value for e in self.emails])}" if self.emails else "",
+            f", address: {self.address.value}" if self.address else "",
+        ))
 
     def set_note(self, note: str):
         """Set or replace a free-form note.
@@ -390,6 +661,8 @@ class Record:
             note: Note text to set.
         """
         self.note = note
+        self._note_lower = note.lower() if note else None
+        _touch()
 
     def get_note(self) -> str | None:
         """Return current note text or None.
@@ -402,20 +675,114 @@ class Record:
     def remove_note(self):
         """Delete the note from the record."""
         self.note = None
+        self._note_lower = None
+        _touch()
 
 
 class AddressBook(UserDict):
     """Collection of records with search/sort helpers and birthday calculations."""
 
+    # Derived search indexes; rebuilt on demand and never persisted.
+    _INDEX_ATTRS = (
+        "_record_list",
+        "_record_list_revision",
+        "_name_bigrams",
+        "_name_order",
+        "_name_next",
+    )
+
+    def __init__(self, *args, **kwargs):
+        self._reset_indexes()
+        super().__init__(*args, **kwargs)
+        _touch()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in self._INDEX_ATTRS:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        # Books saved by earlier versions carry an unused schema stamp.
+        state.pop("schema_version", None)
+        self.__dict__.update(state)
+        self._reset_indexes()
+        _touch()
+
+    def _reset_indexes(self) -> None:
+        """Drop derived search indexes so they are rebuilt on next use."""
+        self._record_list: Tuple[Record, ...] = ()
+        self._record_list_revision = -1
+        # Bigram -> keys of records whose lowercased name contains it, and
+        # each key's insertion rank; None until the first name search, then
+        # updated in place as records are stored and removed.
+        self._name_bigrams: Optional[Dict[str, Set[str]]] = None
+        self._name_order: Dict[str, int] = {}
+        self._name_next = 0
+
+    def __setitem__(self, key, item):
+        self._store(key, item)
+
+    def __delitem__(self, key):
+        self._remove(key)
+
+    def _store(self, key: str, record: Record) -> None:
+        """Put `record` under `key`, keeping the name index current.
+
+        Args:
+            key: Mapping key, normally the record's name.
+            record: Record to store.
+        """
+        postings = self._name_bigrams
+        if postings is not None:
+            replaced = self.data.get(key)
+            if replaced is None:
+                # Overwriting keeps a key's place, as it does in the dict.
+                self._name_order[key] = self._name_next
+                self._name_next += 1
+            else:
+                _discard_bigrams(postings, key, replaced._name_lower)
+            for bigram in _bigrams(record._name_lower):
+                postings.setdefault(bigram, set()).add(key)
+        self.data[key] = record
+        _touch()
+
+    def _remove(self, key: str) -> None:
+        """Delete the record under `key`, keeping the name index current.
+
+        Args:
+            key: Mapping key to delete.
+
+        Raises:
+            KeyError: If the key is not present.
+        """
+        record = self.data.pop(key)
+        if self._name_bigrams is not None:
+            _discard_bigrams(self._name_bigrams, key, record._name_lower)
+            del self._name_order[key]
+        _touch()
+
+    @property
+    def revision(self) -> int:
+        """Counter that advances whenever any book or record is modified.
+
+        The counter is shared by all books, so combine it with the book's
+        identity when using it as a cache key.
+
+        Returns:
+            int: Current revision number.
+        """
+        return _revision
+
     def add_record(self, record: Record) -> None:
         """Insert or overwrite a record by its name key.
 
         Args:
             record: The contact record to store.
         """
-        self.data[record.name.value] = record
+        self._store(record.name.value, record)
 
-    def find(self, name: str) -> Record:
+    def find(self, name: str) -> Optional[Record]:
         """Return a record by exact name or None if not found.
 
         Args:
@@ -436,7 +803,7 @@ class AddressBook(UserDict):
             RecordNotFoundError: If the name is not present.
         """
         if name in self.data:
-            del self.data[name]
+            self._remove(name)
         else:
             raise RecordNotFoundError(f"Record with name '{name}' not found.")
 
@@ -450,14 +817,49 @@ class AddressBook(UserDict):
         Returns:
             List[Record]: Matching records.
         """
-        results: List[Record] = []
-        lower_query = query.lower()
+        query = query.lower()
+        if len(query) < 2:
+            return [
+                record
+                for record in self.data.values()
+                if query in record._name_lower
+            ]
+
+        # Only names holding every bigram of the query can contain it.
+        postings = self._name_index()
+        candidates: List[Set[str]] = []
+        for bigram in _bigrams(query):
+            keys = postings.get(bigram)
+            if not keys:
+                return []
+            candidates.append(keys)
+        candidates.sort(key=len)
+        data = self.data
+        return [
+            data[key]
+            for key in sorted(
+                set.intersection(*candidates), key=self._name_order.__getitem__
+            )
+            if query in data[key]._name_lower
+        ]
 
-        for record in self.data.values():
-            if lower_query in record.name.value.lower():
-                results.append(record)
+    def _name_index(self) -> Dict[str, Set[str]]:
+        """Return the bigram postings for record names, building them once.
 
-        return results
+        Returns:
+            Dict[str, Set[str]]: Bigram -> keys of records whose lowercased
+            name contains it. Later changes are applied by `_store` and
+            `_remove`.
+        """
+        if self._name_bigrams is None:
+            postings: Dict[str, Set[str]] = {}
+            for rank, (key, record) in enumerate(self.data.items()):
+                self._name_order[key] = rank
+                for bigram in _bigrams(record._name_lower):
+                    postings.setdefault(bigram, set()).add(key)
+            self._name_next = len(self.data)
+            self._name_bigrams = postings
+        return self._name_bigrams
 
     @property
     def is_empty(self) -> bool:
@@ -477,6 +879,18 @@ class AddressBook(UserDict):
         """
         return self.data
 
+    @property
+    def record_list(self) -> Tuple[Record, ...]:
+        """Records in insertion order, cached until the book changes.
+
+        Returns:
+            Tuple[Record, ...]: Snapshot of all stored records.
+        """
+        if self._record_list_revision != _revision:
+            self._record_list = tuple(self.data.values())
+            self._record_list_revision = _revision
+        return self._record_list
+
     def search_by_notes(self, query: str) -> List[Record]:
         """Search records that contain the query substring in notes.
 
@@ -486,14 +900,13 @@ class AddressBook(UserDict):
         Returns:
             List[Record]: Records whose notes contain the substring.
         """
-        lower_query = query.lower()
-        results: List[Record] = []
-
-        for record in self.data.values():
-            if record.note and lower_query in record.note.lower():
-                results.append(record)
-
-        return results
+        query = query.lower()
+        # Notes are kept lowercased on each record, so this is a plain scan.
+        return [
+            record
+            for record in self.data.values()
+            if record._note_lower is not None and query in record._note_lower
+        ]
 
     def search_by_tags(self, tag_query: str) -> List[Record]:
         """Search records whose notes contain a hashtag matching the query.
@@ -530,7 +943,9 @@ class AddressBook(UserDict):
 
         return sorted(self.values(), key=tag_key)
 
-    def get_upcoming_birthdays(self, days: int = 7) -> List[Dict[str, str]]:
+    def get_upcoming_birthdays(
+        self, days: int = 7, today: Optional[date] = None
+    ) -> List[Dict[str, str]]:
         """
         Return contacts with upcoming birthdays within the given number of days.
 
@@ -539,11 +954,13 @@ class AddressBook(UserDict):
         already passed, the next occurrence in the following year is used.
 
         If the next birthday falls on a weekend (Saturday or Sunday), the
-        congratulation date is shifted to the following Monday.
+        congratulation date is shifted to the following Monday. In non-leap
+        years, birthdays on 29 February are treated as falling on 28 February.
 
         Args:
             days: Number of days from today (inclusive) to look ahead for upcoming
                 birthdays. Defaults to 7.
+            today: Date to count from; defaults to the current date.
 
         Returns:
             List[Dict[str, str]]: Each dict contains:
@@ -551,43 +968,34 @@ class AddressBook(UserDict):
                 - "congratulation_date": date string in "dd.mm.yyyy" format
                   when congratulations should be sent.
         """
-        today_date = datetime.now().date()
-        congratulation_users = []
+        today_date = datetime.now().date() if today is None else today
+
+        # Every birthday that can match falls on one of these (month, day)
+        # pairs; the next occurrence is never more than a year away.
+        targets: Dict[Tuple[int, int], str] = {}
+        for offset in range(min(days, 366) + 1):
+            next_birthday = today_date + timedelta(days=offset)
+            congratulation_date = next_birthday
+            weekday = next_birthday.weekday()
+            if weekday >= 5:
+                # Saturday and Sunday move to the following Monday.
+                congratulation_date += timedelta(days=7 - weekday)
+            congratulation = _format_date(congratulation_date)
+            md = (next_birthday.month, next_birthday.day)
+            targets.setdefault(md, congratulation)
+            if md == (2, 28) and not isleap(next_birthday.year):
+                # 29 February birthdays fall on 28 February in other years.
+                targets.setdefault((2, 29), congratulation)
 
+        congratulation_users = []
         for record in self.data.values():
             if record.birthday is None:
                 continue
-
-            bday = record.birthday.value
-
-            birthday_this_year = datetime(
-                year=today_date.year,
-                month=bday.month,
-                day=bday.day
-            ).date()
-
-            if birthday_this_year < today_date:
-                next_birthday = datetime(
-                    year=today_date.year + 1,
-                    month=bday.month,
-                    day=bday.day
-                ).date()
-            else:
-                next_birthday = birthday_this_year
-
-            diff_days = (next_birthday - today_date).days
-
-            if 0 <= diff_days <= days:
-                congratulation_date = next_birthday
-
-                if congratulation_date.weekday() == 5:
-                    congratulation_date += timedelta(days=2)
-                elif congratulation_date.weekday() == 6:
-                    congratulation_date += timedelta(days=1)
-
+            target = targets.get(record.birthday.md)
+            if target is not None:
                 congratulation_users.append({
                     "name": record.name.value,
-                    "congratulation_date": congratulation_date.strftime("%d.%m.%Y"),
+                    "congratulation_date": target,
                 })
 
         return congratulation_users
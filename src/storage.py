@@ -1,20 +1,81 @@
 """Persistence layer for loading/saving the AddressBook using pickle."""
 
+import gzip
+import logging
+import mmap
+import os
 import pickle
+import zlib
 from pathlib import Path
+from typing import Any, BinaryIO, Optional, Tuple, Union
 
+from .exceptions import DataFileTooLargeError
 from .models import AddressBook
 
+__all__ = ["AddressBookStorage"]
+
+
+# Newest protocol (5 on Python 3.8+): framed and faster to dump and load.
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+_WRITE_BUFFER_SIZE = 1 << 20
+# Contact data is repetitive text; the fastest gzip level already shrinks
+# it several times over for a small fraction of the pickling cost.
+_COMPRESS_LEVEL = 1
+_GZIP_MAGIC = b"\x1f\x8b"
+# Larger files are mapped and read straight from the page cache; below this
+# the mapping setup costs more than the buffered reads it saves.
+_MMAP_THRESHOLD = 1 << 20
+
+# What a truncated, corrupt or incompatible data file raises while loading.
+# BadGzipFile is an OSError, so it is listed to keep it apart from real I/O
+# failures, which propagate.
+_CORRUPT_FILE_ERRORS = (
+    pickle.UnpicklingError,
+    gzip.BadGzipFile,
+    zlib.error,
+    EOFError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
+
+_logger = logging.getLogger(__name__)
+
+# (inode, size, mtime_ns) of the data file.
+_FileKey = Tuple[int, int, int]
+
 
 class AddressBookStorage:
     """File-backed storage for the AddressBook.
 
+    The book is stored as a gzip-compressed pickle; uncompressed pickles
+    from earlier versions are still read.
+
     Args:
-        path: Filesystem path to the pickle file.
+        path: Filesystem path to the pickle file, as a string or path-like.
     """
 
-    def __init__(self, path: str):
-        self.path = Path(path)
+    # Larger data files are refused rather than unpickled into memory.
+    MAX_PICKLE_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self.path = path if isinstance(path, Path) else Path(path)
+        # Last book loaded or saved, the file identity it matches and the
+        # book revision at that point.
+        self._cache: Optional[AddressBook] = None
+        self._cache_key: Optional[_FileKey] = None
+        self._cache_revision = -1
+
+    def _file_key(self) -> Optional[_FileKey]:
+        """Return the data file's (inode, size, mtime_ns), or None if missing."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
 
     def load_or_new(self) -> AddressBook:
         """Load an AddressBook from disk or return a new empty one.
@@ -22,40 +83,87 @@ class AddressBookStorage:
         Returns:
             AddressBook: Loaded book if the file exists and is valid, otherwise a new instance.
 
+        Raises:
+            DataFileTooLargeError: If the file is larger than `MAX_PICKLE_BYTES`.
+
         Notes:
-            - Any unpickling or type errors fall back to returning a new AddressBook.
-            - After loading, performs migration to ensure backward compatibility of records.
+            - While the file is unchanged on disk (same inode, size and mtime)
+              and the previously loaded book has not been modified since,
+              repeated calls return that instance.
+            - An unreadable or corrupt pickle is logged and falls back to a new
+              AddressBook; other OS errors (e.g. permissions) propagate.
+            - Records saved by earlier versions are migrated while unpickling
+              (see `Record.__setstate__`).
         """
-        if not self.path.exists():
-            return AddressBook()
+        # Open first instead of checking exists()/stat(): the file could
+        # vanish or be replaced between the check and the open.
         try:
-            with open(self.path, "rb") as f:
-                book = pickle.load(f)
+            raw = open(self.path, "rb")
+        except FileNotFoundError:
+            return AddressBook()
+        with raw:
+            st = os.fstat(raw.fileno())
+            cache_key = st.st_ino, st.st_size, st.st_mtime_ns
+            # Reuse the cached book only while it still matches the file.
+            if (
+                cache_key == self._cache_key
+                and self._cache is not None
+                and self._cache.revision == self._cache_revision
+            ):
+                return self._cache
+            if st.st_size > self.MAX_PICKLE_BYTES:
+                # Falling back to an empty book here would let the next save
+                # overwrite the user's data, so refuse to continue instead.
+                raise DataFileTooLargeError(
+                    f"Address book {self.path} is too large to load "
+                    f"({st.st_size} bytes, limit {self.MAX_PICKLE_BYTES})."
+                )
+            try:
+                if st.st_size > _MMAP_THRESHOLD:
+                    with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        book = self._unpickle(mm)
+                else:
+                    book = self._unpickle(raw)
                 if not isinstance(book, AddressBook):
                     return AddressBook()
-                self._migrate_records(book)
-                return book
-        except Exception:
-            return AddressBook()
+            except _CORRUPT_FILE_ERRORS as e:
+                _logger.warning(
+                    "Could not load address book from %s: %r", self.path, e
+                )
+                return AddressBook()
+        self._remember(book, cache_key)
+        return book
 
     @staticmethod
-    def _migrate_records(book: AddressBook) -> None:
-        """Ensure old pickled records have new attributes introduced over time.
+    def _unpickle(source: Union[BinaryIO, mmap.mmap]) -> Any:
+        """Unpickle a saved book from a gzip-compressed or plain pickle stream.
 
         Args:
-            book: AddressBook instance to migrate in-place.
+            source: Open data file or a read-only mapping of it, positioned
+                at the start.
+
+        Returns:
+            Any: The unpickled object.
         """
-        for record in book.data.values():
-            if not hasattr(record, "emails"):
-                record.emails = []
-            if not hasattr(record, "address"):
-                record.address = None
-            if not hasattr(record, "note"):
-                record.note = None
+        # Files written before compression was added are plain pickles.
+        if source.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC:
+            source.seek(0)
+            with gzip.GzipFile(fileobj=source, mode="rb") as f:
+                return pickle.load(f)
+        source.seek(0)
+        return pickle.load(source)
+
+    def _remember(self, book: AddressBook, key: Optional[_FileKey]) -> None:
+        """Record `book` as identical to the data file identified by `key`."""
+        self._cache, self._cache_key = book, key
+        self._cache_revision = book.revision
 
     def save(self, book: AddressBook) -> None:
         """Persist the AddressBook to disk.
 
+        Nothing is written when `book` is the instance last loaded or saved,
+        has not been modified since, and the file on disk is unchanged.
+
         Args:
             book: AddressBook instance to persist.
 
@@ -63,6 +171,33 @@ class AddressBookStorage:
             OSError: If directories cannot be created or file cannot be written.
             IOError: If the file operation fails.
         """
+        if (
+            book is self._cache
+            and book.revision == self._cache_revision
+            and self._cache_key is not None
+            and self._file_key() == self._cache_key
+        ):
+            return
+        self._cache = self._cache_key = None
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "wb") as f:
-            pickle.dump(book, f)
+        # Write a sibling file and rename it over the target, so a crash
+        # mid-save leaves the previous book intact.
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            # Pickle straight into a large write buffer: no intermediate
+            # bytes object from dumps(), and few write() syscalls.
+            with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as raw:
+                with gzip.GzipFile(
+                    fileobj=raw,
+                    mode="wb",
+                    compresslevel=_COMPRESS_LEVEL,
+                    mtime=0,
+                ) as f:
+                    pickle.dump(book, f, protocol=_PICKLE_PROTOCOL)
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._remember(book, self._file_key())